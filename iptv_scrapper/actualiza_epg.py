@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 
 import requests
+from requests.adapters import HTTPAdapter
 
 warnings.filterwarnings("ignore")
 
@@ -18,6 +19,9 @@ OUTPUT_FILE = "epg_actualizado.xml"
 MAX_WORKERS = 20
 TIMEOUT = 30
 
+# Prefijos de canales españoles. Formato: "ES| CANAL" o "ES | CANAL" o "ES|CANAL"
+SPANISH_PREFIXES = ("ES|", "ES |", "SPAIN|", "SPAIN |")
+
 xml_lock = Lock()
 stats_lock = Lock()
 
@@ -33,6 +37,13 @@ def get_api_url(action):
     return f"{URL_BASE}/player_api.php?username={USER}&password={PASS}&action={action}"
 
 
+# URL base del EPG corto: se construye una vez, no por cada canal
+SHORT_EPG_URL = get_api_url("get_short_epg")
+
+# "2024-01-31 20:00:00" -> "20240131200000" en una sola pasada
+EPG_DATE_SEPARATORS = str.maketrans("", "", " -:")
+
+
 def decode_safe(text):
     """Decodifica base64 de forma segura"""
     try:
@@ -46,14 +57,7 @@ def is_spanish_channel(stream):
     name = stream.get("name", "")
 
     # Buscar prefijos españoles al inicio del nombre
-    # Formato: "ES| CANAL" o "ES | CANAL" o "ES|CANAL"
-    spanish_prefixes = ["ES|", "ES |", "SPAIN|", "SPAIN |"]
-
-    for prefix in spanish_prefixes:
-        if name.upper().startswith(prefix):
-            return True
-
-    return False
+    return name.upper().startswith(SPANISH_PREFIXES)
 
 
 def process_channel(stream, root, session):
@@ -70,7 +74,7 @@ def process_channel(stream, root, session):
                 ET.SubElement(chan_node, "icon", src=stream["stream_icon"])
 
         # Obtener EPG
-        epg_url = f"{get_api_url('get_short_epg')}&stream_id={stream_id}"
+        epg_url = f"{SHORT_EPG_URL}&stream_id={stream_id}"
         epg_data = session.get(epg_url, timeout=TIMEOUT).json()
 
         programas_canal = 0
@@ -80,8 +84,8 @@ def process_channel(stream, root, session):
                     title = decode_safe(entry["title"])
                     desc = decode_safe(entry["description"])
 
-                    start = entry["start"].replace(" ", "").replace("-", "").replace(":", "")
-                    end = entry["end"].replace(" ", "").replace("-", "").replace(":", "")
+                    start = entry["start"].translate(EPG_DATE_SEPARATORS)
+                    end = entry["end"].translate(EPG_DATE_SEPARATORS)
 
                     with xml_lock:
                         prog_node = ET.SubElement(
@@ -128,6 +132,10 @@ def create_xmltv_spain():
     try:
         session = requests.Session()
         session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+        # Un hueco de pool por worker: con el tamaño por defecto (10) se descartan conexiones
+        adapter = HTTPAdapter(pool_maxsize=MAX_WORKERS)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
 
         streams_resp = session.get(get_api_url("get_live_streams"), timeout=30)
         all_streams = streams_resp.json()
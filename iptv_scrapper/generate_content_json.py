@@ -24,6 +24,7 @@ from sqlalchemy import text
 
 from database import DatabasePG
 from utils.constants import (
+    JSON_GZIP_COMPRESSLEVEL,
     SYNC_METADATA_ID,
 )
 
@@ -35,6 +36,20 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def escribir_json_cache(payload: dict, json_path: Path, gz_path: Path):
+    """
+    Serializa el payload una sola vez y escribe el .json y el .json.gz.
+    Sin indent, json usa el encoder en C (varias veces más rápido que indent=2).
+    """
+    contenido = json.dumps(payload, ensure_ascii=False, cls=DateTimeEncoder).encode("utf-8")
+    json_path.write_bytes(contenido)
+    with (
+        open(gz_path, "wb") as f,
+        gzip.GzipFile(fileobj=f, mode="wb", compresslevel=JSON_GZIP_COMPRESSLEVEL) as gz,
+    ):
+        gz.write(contenido)
+
+
 async def generar_channels_json():
     """
     Genera el archivo channels.json.gz con todos los canales.
@@ -93,11 +108,7 @@ async def generar_channels_json():
             json_path = json_dir / "channels.json"
             gz_path = json_dir / "channels.json.gz"
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
-
-            with open(gz_path, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as gz:
-                gz.write(json.dumps(payload, ensure_ascii=False, cls=DateTimeEncoder))
+            escribir_json_cache(payload, json_path, gz_path)
 
             json_size_mb = json_path.stat().st_size / (1024 * 1024)
             gz_size_mb = gz_path.stat().st_size / (1024 * 1024)
@@ -210,11 +221,7 @@ async def generar_movies_json():
             json_path = json_dir / "movies.json"
             gz_path = json_dir / "movies.json.gz"
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
-
-            with open(gz_path, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as gz:
-                gz.write(json.dumps(payload, ensure_ascii=False, cls=DateTimeEncoder))
+            escribir_json_cache(payload, json_path, gz_path)
 
             json_size_mb = json_path.stat().st_size / (1024 * 1024)
             gz_size_mb = gz_path.stat().st_size / (1024 * 1024)
@@ -330,11 +337,7 @@ async def generar_series_json():
             json_path = json_dir / "series.json"
             gz_path = json_dir / "series.json.gz"
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
-
-            with open(gz_path, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as gz:
-                gz.write(json.dumps(payload, ensure_ascii=False, cls=DateTimeEncoder))
+            escribir_json_cache(payload, json_path, gz_path)
 
             json_size_mb = json_path.stat().st_size / (1024 * 1024)
             gz_size_mb = gz_path.stat().st_size / (1024 * 1024)
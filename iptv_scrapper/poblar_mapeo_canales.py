@@ -107,18 +107,21 @@ async def buscar_channels_por_patron(variante: dict) -> list:
             if not result_rows:
                 return []
 
+            # Compilar una vez por variante, no por cada fila devuelta
             nombre_regex = variante.get("nombre_regex")
             grupo_regex = variante.get("grupo_regex")
+            nombre_pattern = re.compile(nombre_regex, re.IGNORECASE) if nombre_regex else None
+            grupo_pattern = re.compile(grupo_regex, re.IGNORECASE) if grupo_regex else None
 
             channels = []
             for row in result_rows:
                 nombre = row.get("nombre", "")
                 grupo = row.get("grupo", "")
 
-                if nombre_regex and not re.search(nombre_regex, nombre, re.IGNORECASE):
+                if nombre_pattern and not nombre_pattern.search(nombre):
                     continue
 
-                if grupo_regex and not re.search(grupo_regex, grupo, re.IGNORECASE):
+                if grupo_pattern and not grupo_pattern.search(grupo):
                     continue
 
                 channels.append(dict(row))
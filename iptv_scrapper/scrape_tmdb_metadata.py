@@ -55,6 +55,7 @@ TMDB_READ_TOKEN = os.getenv("TMDB_READ_TOKEN", "")
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 RATE_LIMIT_REQUESTS = 40
 RATE_LIMIT_WINDOW = 10  # segundos
+CROSS_REFERENCE_CACHE_TTL = 300  # segundos
 
 # Tolerancia en años al verificar resultados de TMDB (±1 año)
 YEAR_MATCH_TOLERANCE = 1
@@ -275,6 +276,7 @@ class TMDBScraper:
         self.last_request_time = time.time()
         self.request_count = 0
         self.dry_run = dry_run
+        self._metadata_cache: dict[tuple[str, str], tuple[float, dict | None]] = {}
 
     def _query(self, sql: str, params: dict | tuple = ()) -> list[dict[str, Any]]:
         """Execute SELECT via session. Returns list[dict]."""
@@ -287,13 +289,24 @@ class TMDBScraper:
         self._session.commit()
         return result.rowcount
 
+    def _get_cached_metadata(self, table: str, tmdb_id: str) -> dict | None:
+        """Fila de movies/series_metadata por tmdb_id, cacheada CROSS_REFERENCE_CACHE_TTL."""
+        key = (table, tmdb_id)
+        cached = self._metadata_cache.get(key)
+        if cached and time.monotonic() - cached[0] < CROSS_REFERENCE_CACHE_TTL:
+            return cached[1]
+        rows = self._query(f"SELECT * FROM {table} WHERE tmdb_id = :tmdb_id", {"tmdb_id": tmdb_id})
+        row = rows[0] if rows else None
+        self._metadata_cache[key] = (time.monotonic(), row)
+        return row
+
     def _rate_limit(self):
         current_time = time.time()
         time_elapsed = current_time - self.last_request_time
         if time_elapsed < RATE_LIMIT_WINDOW:
             if self.request_count >= RATE_LIMIT_REQUESTS:
                 sleep_time = RATE_LIMIT_WINDOW - time_elapsed
-                logger.info(f"Rate limit. Esperando {sleep_time:.2f}s...")
+                logger.info("Rate limit. Esperando %.2fs...", sleep_time)
                 time.sleep(sleep_time)
                 self.request_count = 0
                 self.last_request_time = time.time()
@@ -312,7 +325,7 @@ class TMDBScraper:
             results = response.json().get("results", [])
             return _pick_best_result(results, year, date_key="release_date")
         except Exception as e:
-            logger.warning(f"Error buscando película '{title}': {e}")
+            logger.warning("Error buscando película '%s': %s", title, e)
             return None
 
     def _search_tv(self, title: str, year: int | None = None) -> dict | None:
@@ -325,7 +338,7 @@ class TMDBScraper:
             results = response.json().get("results", [])
             return _pick_best_result(results, year, date_key="first_air_date")
         except Exception as e:
-            logger.warning(f"Error buscando serie '{title}': {e}")
+            logger.warning("Error buscando serie '%s': %s", title, e)
             return None
 
     def _get_movie_details(self, tmdb_id: str) -> dict | None:
@@ -390,18 +403,31 @@ class TMDBScraper:
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", "5"))
                     logger.warning(
-                        f"HTTP 429 {content_type} {tmdb_id}. "
-                        f"Esperando {retry_after}s (intento {attempt}/{max_retries})"
+                        "HTTP 429 %s %s. Esperando %ss (intento %d/%d)",
+                        content_type,
+                        tmdb_id,
+                        retry_after,
+                        attempt,
+                        max_retries,
                     )
                     time.sleep(retry_after)
                     continue
                 logger.warning(
-                    f"HTTP {response.status_code} {content_type} {tmdb_id} "
-                    f"(intento {attempt}/{max_retries})"
+                    "HTTP %s %s %s (intento %d/%d)",
+                    response.status_code,
+                    content_type,
+                    tmdb_id,
+                    attempt,
+                    max_retries,
                 )
             except Exception as e:
                 logger.warning(
-                    f"Error {content_type} {tmdb_id}: {e} (intento {attempt}/{max_retries})"
+                    "Error %s %s: %s (intento %d/%d)",
+                    content_type,
+                    tmdb_id,
+                    e,
+                    attempt,
+                    max_retries,
                 )
             if attempt < max_retries:
                 time.sleep(2 ** (attempt - 1))
@@ -434,7 +460,9 @@ class TMDBScraper:
             data_en = response_en.json() if response_en.status_code == 200 else {}
             return {"es": data_es, "en": data_en}
         except Exception as e:
-            logger.warning(f"Error obteniendo temporada {season_number} de TMDB {tmdb_id}: {e}")
+            logger.warning(
+                "Error obteniendo temporada %s de TMDB %s: %s", season_number, tmdb_id, e
+            )
             return None
 
     def _get_movies_without_metadata(self, limit: int = 100) -> list[dict]:
@@ -580,6 +608,7 @@ class TMDBScraper:
                         "tmdb_data": json.dumps(result.tmdb_data) if result.tmdb_data else None,
                     },
                 )
+                self._metadata_cache.pop(("movies_metadata", result.tmdb_id), None)
                 # Check if this tmdb_id is already assigned to ANOTHER catalog entry.
                 # If so, merge streams into existing entry and delete duplicate.
                 existing = self._query(
@@ -607,8 +636,9 @@ class TMDBScraper:
                             {"current_id": current_id},
                         )
                         logger.info(
-                            f"   🔀 Mergeado: streams movidos a catalog {keep_id}, "
-                            f"provider {result.provider_id} eliminado"
+                            "   🔀 Mergeado: streams movidos a catalog %s, provider %s eliminado",
+                            keep_id,
+                            result.provider_id,
                         )
                         # Actualizar canonical_key del entry sobreviviente
                         self._command(
@@ -628,9 +658,9 @@ class TMDBScraper:
                     "DELETE FROM scraper_failures WHERE provider_id = :provider_id",
                     {"provider_id": result.provider_id},
                 )
-                logger.info(f"   💾 Guardado TMDB {result.tmdb_id} + catalog actualizado")
+                logger.info("   💾 Guardado TMDB %s + catalog actualizado", result.tmdb_id)
             except Exception as e:
-                logger.error(f"Error guardando metadata: {e}")
+                logger.error("Error guardando metadata: %s", e)
         else:
             sql = """
             UPDATE movies_catalog
@@ -659,7 +689,7 @@ class TMDBScraper:
                 )
                 logger.info("   💾 Guardado como no encontrado")
             except Exception as e:
-                logger.error(f"Error guardando metadata: {e}")
+                logger.error("Error guardando metadata: %s", e)
 
     def _process_movie(self, row: dict) -> ScrapeResult:
         provider_id = row["provider_id"]
@@ -667,19 +697,15 @@ class TMDBScraper:
         year = row["year"]
         nombre_dedup_key = row.get("nombre_dedup_key")
 
-        logger.info(f"🎬 {nombre[:60]}...")
+        logger.info("🎬 %.60s...", nombre)
 
         # Cross-reference: mismo nombre_dedup_key ya tiene tmdb_id
         if nombre_dedup_key and nombre_dedup_key in self._movie_tmdb_by_dedup:
             tmdb_id = self._movie_tmdb_by_dedup[nombre_dedup_key]
             try:
-                rows = self._query(
-                    "SELECT * FROM movies_metadata WHERE tmdb_id = :tmdb_id",
-                    {"tmdb_id": tmdb_id},
-                )
-                if rows:
-                    m = rows[0]
-                    logger.info(f"   ✓ {m.get('title')} (TMDB: {tmdb_id}, cross-reference)")
+                m = self._get_cached_metadata("movies_metadata", tmdb_id)
+                if m:
+                    logger.info("   ✓ %s (TMDB: %s, cross-reference)", m.get("title"), tmdb_id)
                     return ScrapeResult(
                         provider_id=provider_id,
                         tmdb_id=tmdb_id,
@@ -701,7 +727,7 @@ class TMDBScraper:
                         tmdb_data=m.get("tmdb_data"),
                     )
             except Exception as e:
-                logger.warning(f"⚠️  Cross-reference falló para '{nombre}': {e}")
+                logger.warning("⚠️  Cross-reference falló para '%s': %s", nombre, e)
 
         search_title, search_year = extract_search_title(nombre)
         if not search_title:
@@ -710,11 +736,11 @@ class TMDBScraper:
             )
 
         effective_year = search_year or year
-        logger.debug(f"   🔍 Buscando: '{search_title}' ({effective_year})")
+        logger.debug("   🔍 Buscando: '%s' (%s)", search_title, effective_year)
 
         search_result = self._search_movie(search_title, effective_year)
         if not search_result:
-            logger.info(f"   ❌ No encontrado en TMDB: '{search_title}' ({effective_year})")
+            logger.info("   ❌ No encontrado en TMDB: '%s' (%s)", search_title, effective_year)
             return ScrapeResult(
                 provider_id=provider_id,
                 not_found=True,
@@ -729,7 +755,7 @@ class TMDBScraper:
             )
 
         data = details["combined"]
-        logger.info(f"   ✓ {data.get('title')} (TMDB: {tmdb_id})")
+        logger.info("   ✓ %s (TMDB: %s)", data.get("title"), tmdb_id)
 
         release_date = _or_none(data.get("release_date"))
         overview_es = _or_none(data.get("overview")) or _or_none(data.get("overview_en"))
@@ -764,7 +790,7 @@ class TMDBScraper:
         nombre = row["nombre"]
         year = row["year"]
 
-        logger.info(f"📺 {serie_name[:60]}... [{series_key}]")
+        logger.info("📺 %.60s... [%s]", serie_name, series_key)
 
         if not series_key:
             return SeriesScrapeResult(series_key="", not_found=True, error="series_key vacío")
@@ -780,13 +806,9 @@ class TMDBScraper:
         if clean_search in self._series_tmdb_by_title:
             tmdb_id = self._series_tmdb_by_title[clean_search]
             try:
-                rows = self._query(
-                    "SELECT * FROM series_metadata WHERE tmdb_id = :tmdb_id",
-                    {"tmdb_id": tmdb_id},
-                )
-                if rows:
-                    m = rows[0]
-                    logger.info(f"   ✓ {m.get('title')} (TMDB: {tmdb_id}, cross-reference)")
+                m = self._get_cached_metadata("series_metadata", tmdb_id)
+                if m:
+                    logger.info("   ✓ %s (TMDB: %s, cross-reference)", m.get("title"), tmdb_id)
                     return SeriesScrapeResult(
                         series_key=series_key,
                         tmdb_id=tmdb_id,
@@ -807,14 +829,14 @@ class TMDBScraper:
                         tmdb_data=m.get("tmdb_data"),
                     )
             except Exception as e:
-                logger.warning(f"⚠️  Cross-reference falló para '{serie_name}': {e}")
+                logger.warning("⚠️  Cross-reference falló para '%s': %s", serie_name, e)
 
         effective_year = search_year or year
-        logger.debug(f"   🔍 Buscando: '{search_title}' ({effective_year})")
+        logger.debug("   🔍 Buscando: '%s' (%s)", search_title, effective_year)
 
         search_result = self._search_tv(search_title, effective_year)
         if not search_result:
-            logger.info(f"   ❌ No encontrada en TMDB: '{search_title}' ({effective_year})")
+            logger.info("   ❌ No encontrada en TMDB: '%s' (%s)", search_title, effective_year)
             return SeriesScrapeResult(
                 series_key=series_key,
                 not_found=True,
@@ -829,7 +851,7 @@ class TMDBScraper:
             )
 
         data = details["combined"]
-        logger.info(f"   ✓ {data.get('name')} (TMDB: {tmdb_id})")
+        logger.info("   ✓ %s (TMDB: %s)", data.get("name"), tmdb_id)
 
         first_air_date = _or_none(data.get("first_air_date"))
         overview_es = _or_none(data.get("overview")) or _or_none(data.get("overview_en"))
@@ -914,6 +936,7 @@ class TMDBScraper:
                         "tmdb_data": json.dumps(result.tmdb_data) if result.tmdb_data else None,
                     },
                 )
+                self._metadata_cache.pop(("series_metadata", result.tmdb_id), None)
                 # Check if this tmdb_id is already assigned to ANOTHER catalog entry.
                 # If so, merge episodes/streams into existing entry and delete duplicate.
                 existing = self._query(
@@ -980,8 +1003,9 @@ class TMDBScraper:
                             {"current_id": current_id},
                         )
                         logger.info(
-                            f"   🔀 Mergeado: episodios → catalog {keep_id}, "
-                            f"series_key {result.series_key} eliminado"
+                            "   🔀 Mergeado: episodios → catalog %s, series_key %s eliminado",
+                            keep_id,
+                            result.series_key,
                         )
                         # Actualizar canonical_key del entry sobreviviente
                         self._command(
@@ -1001,11 +1025,11 @@ class TMDBScraper:
                     "DELETE FROM scraper_failures WHERE series_key = :series_key",
                     {"series_key": result.series_key},
                 )
-                logger.info(f"   💾 Guardado TMDB {result.tmdb_id} + catalog actualizado")
+                logger.info("   💾 Guardado TMDB %s + catalog actualizado", result.tmdb_id)
                 # Procesar episodios de la serie
                 self._process_episodes_for_series(result.tmdb_id, result.series_key)
             except Exception as e:
-                logger.error(f"Error guardando metadata de serie: {e}")
+                logger.error("Error guardando metadata de serie: %s", e)
         else:
             sql = """
             UPDATE series_catalog
@@ -1034,7 +1058,7 @@ class TMDBScraper:
                 )
                 logger.info("   💾 Guardado como no encontrado")
             except Exception as e:
-                logger.error(f"Error guardando metadata de serie: {e}")
+                logger.error("Error guardando metadata de serie: %s", e)
 
     def _process_episodes_for_series(self, tmdb_id: str, series_key: str, series_name: str = ""):
         """Procesa episodios de una serie desde TMDB para actualizar datos existentes."""
@@ -1071,14 +1095,17 @@ class TMDBScraper:
                 seasons_to_process[sn].append(ep)
 
             logger.info(
-                f"   📺 {series_name[:60]} — {len(episode_rows)} episodios en {len(seasons_to_process)} temporadas"
+                "   📺 %.60s — %d episodios en %d temporadas",
+                series_name,
+                len(episode_rows),
+                len(seasons_to_process),
             )
 
             for season_number, season_episodes in seasons_to_process.items():
                 # Obtener datos de TMDB para esta temporada
                 season_data = self._get_tv_season_details(tmdb_id, season_number)
                 if not season_data:
-                    logger.warning(f"   ⚠️ Temporada {season_number} no encontrada en TMDB")
+                    logger.warning("   ⚠️ Temporada %s no encontrada en TMDB", season_number)
                     # Marcar todos los episodios de esta temporada como not_found
                     for ep in season_episodes:
                         self._command(
@@ -1119,7 +1146,7 @@ class TMDBScraper:
                         )
 
         except Exception as e:
-            logger.error(f"Error procesando episodios para serie {series_key}: {e}")
+            logger.error("Error procesando episodios para serie %s: %s", series_key, e)
 
     def _save_episode_metadata(self, episode_id: str, data_es: dict, data_en: dict):
         """Guarda metadata de un episodio desde TMDB."""
@@ -1173,7 +1200,7 @@ class TMDBScraper:
                 },
             )
         except Exception as e:
-            logger.error(f"Error guardando episodio {episode_id}: {e}")
+            logger.error("Error guardando episodio %s: %s", episode_id, e)
 
     def _process_batch(
         self,
@@ -1197,14 +1224,13 @@ class TMDBScraper:
                 total_found += 1
             else:
                 total_not_found += 1
-            time.sleep(0.05)
         return total_processed, total_found, total_not_found
 
     def run(
         self, batch_size: int = 100, max_items: int | None = None, retry_not_found: bool = False
     ):
         logger.info("=" * 60)
-        logger.info(f"Scraper TMDB - {datetime.now()}")
+        logger.info("Scraper TMDB - %s", datetime.now())
         if retry_not_found:
             logger.info("MODO: Reintentando items no encontrados anteriormente")
         else:
@@ -1235,10 +1261,10 @@ class TMDBScraper:
                 )
                 self._movie_tmdb_by_dedup = {r["nombre_dedup_key"]: r["tmdb_id"] for r in rows}
                 logger.info(
-                    f"   {len(self._movie_tmdb_by_dedup)} películas con tmdb_id por dedup_key"
+                    "   %d películas con tmdb_id por dedup_key", len(self._movie_tmdb_by_dedup)
                 )
             except Exception as e:
-                logger.warning(f"⚠️  Error cargando cross-reference de películas: {e}")
+                logger.warning("⚠️  Error cargando cross-reference de películas: %s", e)
 
             self._series_tmdb_by_title = {}
             try:
@@ -1251,9 +1277,9 @@ class TMDBScraper:
                             key = re.sub(r"[^\w\s]", " ", t.lower()).strip()
                             if key not in self._series_tmdb_by_title:
                                 self._series_tmdb_by_title[key] = r["tmdb_id"]
-                logger.info(f"   {len(self._series_tmdb_by_title)} series con tmdb_id por título")
+                logger.info("   %d series con tmdb_id por título", len(self._series_tmdb_by_title))
             except Exception as e:
-                logger.warning(f"⚠️  Error cargando cross-reference de series: {e}")
+                logger.warning("⚠️  Error cargando cross-reference de series: %s", e)
 
             # -- Películas --
             logger.info("\n🎬 PROCESANDO PELÍCULAS")
@@ -1265,7 +1291,7 @@ class TMDBScraper:
                 if not movies:
                     logger.info("No hay más películas")
                     break
-                logger.info(f"Lote de {len(movies)} películas")
+                logger.info("Lote de %d películas", len(movies))
                 total_processed, total_found, total_not_found = self._process_batch(
                     movies,
                     self._process_movie,
@@ -1286,7 +1312,7 @@ class TMDBScraper:
                 if not series:
                     logger.info("No hay más series")
                     break
-                logger.info(f"Lote de {len(series)} series")
+                logger.info("Lote de %d series", len(series))
                 total_processed, total_found, total_not_found = self._process_batch(
                     series,
                     self._process_series,
@@ -1311,14 +1337,15 @@ class TMDBScraper:
                 if not series_with_missing:
                     logger.info("No hay más series con episodios sin metadata")
                     break
-                logger.info(f"Lote de {len(series_with_missing)} series con episodios sin metadata")
+                logger.info(
+                    "Lote de %d series con episodios sin metadata", len(series_with_missing)
+                )
                 for s in series_with_missing:
                     self._process_episodes_for_series(
                         s["tmdb_id"], s["series_key"], s["title"] or ""
                     )
                     episodes_processed += 1
-                    time.sleep(0.05)
-            logger.info(f"   Total series procesadas: {episodes_processed}")
+            logger.info("   Total series procesadas: %s", episodes_processed)
 
             self._session = None
 
@@ -1326,11 +1353,11 @@ class TMDBScraper:
         logger.info("\n" + "=" * 60)
         logger.info("RESUMEN")
         logger.info("=" * 60)
-        logger.info(f"Total procesados : {total_processed}")
-        logger.info(f"Encontrados      : {total_found}")
-        logger.info(f"No encontrados   : {total_not_found}")
+        logger.info("Total procesados : %s", total_processed)
+        logger.info("Encontrados      : %s", total_found)
+        logger.info("No encontrados   : %s", total_not_found)
         if total_processed > 0:
-            logger.info(f"Tasa de éxito    : {(total_found / total_processed * 100):.1f}%")
+            logger.info("Tasa de éxito    : %.1f%%", total_found / total_processed * 100)
 
 
 def main():
@@ -1,10 +1,12 @@
 import asyncio
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from sqlalchemy import text
 
 from database import ChannelMappingManager, DatabasePG, DataManagerSupabase
@@ -17,13 +19,16 @@ from utils.constants import (
     HEALTH_CHECK_TIMEOUT,
 )
 
+# Todo lo que va desde el primer paréntesis: "DAZN (Regístrate)" -> "DAZN "
+PARENTESIS_REGEX = re.compile(r"\(.+")
+
 
 def limpia_html(html_canal):
     html_canal = html_canal.replace("&gt", "")
     html_canal = html_canal.replace("&lt", "")
     html_canal = html_canal.replace(";", "")
     html_canal = html_canal.replace("strong", "")
-    html_canal = re.sub(r"\(.+", "", html_canal)
+    html_canal = PARENTESIS_REGEX.sub("", html_canal)
     return html_canal
 
 
@@ -585,7 +590,7 @@ class ScrapperFutbolenlatv:
             canal_title = canal.get("title", "").strip()
 
             # Limpieza básica inline
-            canal_title = re.sub(r"\(.+", "", canal_title).strip()
+            canal_title = PARENTESIS_REGEX.sub("", canal_title).strip()
 
             if not canal_title or canal_title in self.publicidad:
                 continue
@@ -634,6 +639,19 @@ _VIDEO_CONTENT_TYPES = [
     "application/vnd.apple.mpegurl",
     "application/x-mpegurl",
 ]
+_VIDEO_CONTENT_TYPE_REGEX = re.compile("|".join(re.escape(vct) for vct in _VIDEO_CONTENT_TYPES))
+
+
+def _crear_sesion_health_check() -> requests.Session:
+    """Sesión compartida por los hilos del health check, con pool del tamaño de la concurrencia."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HEALTH_CHECK_CONCURRENCY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_HEALTH_CHECK_SESSION = _crear_sesion_health_check()
 
 
 def _check_single_channel(url: str, timeout: int, bytes_to_check: int, proxies: dict[str, str] | None = None) -> tuple:
@@ -642,27 +660,31 @@ def _check_single_channel(url: str, timeout: int, bytes_to_check: int, proxies:
     """
     try:
         start = time.time()
-        response = requests.get(
+        # stream=True + raw.read: si el servidor ignora el Range de un directo,
+        # solo se leen bytes_to_check bytes en vez de descargar el stream entero.
+        with _HEALTH_CHECK_SESSION.get(
             url,
             headers={"Range": f"bytes=0-{bytes_to_check - 1}"},
             timeout=timeout,
             proxies=proxies,
-        )
-        elapsed_ms = int((time.time() - start) * 1000)
-
-        if not response.ok:
-            return False, elapsed_ms, f"HTTP {response.status_code}"
+            stream=True,
+        ) as response:
+            if not response.ok:
+                elapsed_ms = int((time.time() - start) * 1000)
+                return False, elapsed_ms, f"HTTP {response.status_code}"
 
-        content_type = (response.headers.get("Content-Type", "") or "").lower()
-        body = response.content
+            content_type = (response.headers.get("Content-Type", "") or "").lower()
+            body = response.raw.read(bytes_to_check, decode_content=False)
+            # Como antes de usar stream=True: el tiempo incluye la lectura del cuerpo
+            elapsed_ms = int((time.time() - start) * 1000)
 
-        if len(body) == 0:
-            return False, elapsed_ms, "empty_body"
+            if len(body) == 0:
+                return False, elapsed_ms, "empty_body"
 
-        if not any(vct in content_type for vct in _VIDEO_CONTENT_TYPES):
-            return False, elapsed_ms, f"bad_ct:{content_type[:30]}"
+            if not _VIDEO_CONTENT_TYPE_REGEX.search(content_type):
+                return False, elapsed_ms, f"bad_ct:{content_type[:30]}"
 
-        return True, elapsed_ms, "ok"
+            return True, elapsed_ms, "ok"
     except requests.Timeout:
         return False, timeout * 1000, "timeout"
     except Exception as e:
@@ -692,48 +714,69 @@ async def verificar_salud_canales_evento(
 
     print(f"\n🔍 Verificando salud de {total} streams...")
 
+    # Swap iptv-api public domain with the IPTV provider's base URL.
+    # The health check must hit the provider directly: iptv-api's /live endpoint
+    # validates the IPTV provider's credentials against its own user table and
+    # always returns 401. Hitting the provider directly tests the real stream.
+    public_clean = public_domain.rstrip("/") if public_domain and provider_base_url else ""
+    provider_clean = provider_base_url.rstrip("/") if public_clean else ""
+
     sem = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+    # Las variantes que comparten sondeo terminan a la vez: acotar también las
+    # escrituras para no agotar el pool de la BD (update_channel_health ignora errores)
+    db_sem = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+    # Executor propio: el de asyncio por defecto puede tener menos hilos que la concurrencia
+    executor = ThreadPoolExecutor(
+        max_workers=HEALTH_CHECK_CONCURRENCY, thread_name_prefix="health-check"
+    )
     stats = {"ok": 0, "error": 0}
     completed = 0
     total_checks = total
 
+    # Una sola petición por URL: la misma variante puede colgar de varios source_names
+    probes: dict[str, asyncio.Task] = {}
+
+    async def _probe(test_url: str) -> tuple:
+        async with sem:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, _check_single_channel, test_url, HEALTH_CHECK_TIMEOUT, HEALTH_CHECK_BYTES, proxies
+            )
+
     async def _check_variant(sn: str, variant: dict):
         nonlocal completed
-        async with sem:
-            stream_url = variant["stream_url"]
-            if not stream_url:
-                return
+        stream_url = variant["stream_url"]
+        if not stream_url:
+            return
 
-            test_url = stream_url.replace("{{USERNAME}}", provider_username).replace(
-                "{{PASSWORD}}", provider_password
-            )
+        test_url = stream_url.replace("{{USERNAME}}", provider_username).replace(
+            "{{PASSWORD}}", provider_password
+        )
 
-            # Swap iptv-api public domain with the IPTV provider's base URL.
-            # The health check must hit the provider directly: iptv-api's /live endpoint
-            # validates the IPTV provider's credentials against its own user table and
-            # always returns 401. Hitting the provider directly tests the real stream.
-            if public_domain and provider_base_url:
-                public_clean = public_domain.rstrip("/")
-                provider_clean = provider_base_url.rstrip("/")
-                test_url = test_url.replace(public_clean, provider_clean)
+        if public_clean and public_clean in test_url:
+            test_url = test_url.replace(public_clean, provider_clean)
 
-            if test_url == stream_url:
-                return
+        if test_url == stream_url:
+            return
 
-            is_alive, ms, info = await asyncio.get_event_loop().run_in_executor(
-                None, _check_single_channel, test_url, HEALTH_CHECK_TIMEOUT, HEALTH_CHECK_BYTES, proxies
-            )
+        probe = probes.get(test_url)
+        if probe is None:
+            probe = probes[test_url] = asyncio.ensure_future(_probe(test_url))
+        is_alive, ms, info = await probe
 
-            estado = "ok" if is_alive else "error"
+        estado = "ok" if is_alive else "error"
+        async with db_sem:
             await ChannelMappingManager.update_channel_health(variant["channel_id"], estado, ms)
 
-            completed += 1
-            icon = "✅" if is_alive else "❌"
-            print(f"  {icon} [{variant['quality']}] {sn} ({ms}ms)  {'' if is_alive else info}")
-            stats["ok" if is_alive else "error"] += 1
+        completed += 1
+        icon = "✅" if is_alive else "❌"
+        print(f"  {icon} [{variant['quality']}] {sn} ({ms}ms)  {'' if is_alive else info}")
+        stats["ok" if is_alive else "error"] += 1
 
     tasks = [_check_variant(sn, v) for sn, vars_list in variants_map.items() for v in vars_list]
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     print(
         f"  📊 Health check: ✅ {stats['ok']} ok, ❌ {stats['error']} error (de {total_checks} total)"
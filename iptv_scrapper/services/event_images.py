@@ -1,11 +1,12 @@
 import os
 import shutil
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from urllib.request import Request, urlopen
 
-from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageOps
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont, ImageOps
 
 SCALE = 2
 W, H = 1600, 900
@@ -27,6 +28,7 @@ IMAGES_BASE_URL = (
 EVENTOS_DIR = IMAGES_DIR / "events" / "futbol"
 TENNIS_EVENTOS_DIR = IMAGES_DIR / "events" / "tenis"
 EVENT_IMAGES_RETENTION_DAYS = int(os.getenv("EVENT_IMAGES_RETENTION_DAYS", "3"))
+IMAGE_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0"}
 FUTBOL_BACKGROUND_PATH = PROJECT_DIR / "resources" / "event_cards" / "futbol_background.png"
 TENIS_BACKGROUND_PATH = PROJECT_DIR / "resources" / "event_cards" / "tenis_background.png"
 DEFAULT_IMAGES_DIR = PROJECT_DIR / "resources" / "images" / "defaults"
@@ -91,7 +93,7 @@ def obtener_imagen_evento_default(categoria: str, competicion: str = "") -> str:
 
 def cargar_logo(origen, size=(190, 190)):
     if str(origen).startswith(("http://", "https://")):
-        request = Request(str(origen), headers={"User-Agent": "Mozilla/5.0"})
+        request = Request(str(origen), headers=IMAGE_REQUEST_HEADERS)
         with urlopen(request, timeout=20) as response:
             logo = Image.open(BytesIO(response.read())).convert("RGBA")
     else:
@@ -106,7 +108,7 @@ def cargar_logo(origen, size=(190, 190)):
 
 def cargar_bandera(origen, size=(260, 170)):
     if str(origen).startswith(("http://", "https://")):
-        request = Request(str(origen), headers={"User-Agent": "Mozilla/5.0"})
+        request = Request(str(origen), headers=IMAGE_REQUEST_HEADERS)
         with urlopen(request, timeout=20) as response:
             bandera = Image.open(BytesIO(response.read())).convert("RGBA")
     else:
@@ -124,6 +126,30 @@ def cargar_bandera(origen, size=(260, 170)):
     return lienzo
 
 
+@lru_cache(maxsize=1)
+def crear_gradiente_evento() -> Image.Image:
+    """Degradado de la tarjeta de fútbol; es fijo, así que se calcula una vez por proceso."""
+    # El alfa es max(f(y), g(x)): se calculan una fila y una columna y se combinan con PIL
+    fila = Image.frombytes(
+        "L",
+        (W, 1),
+        bytes(
+            max(
+                int(max(0, 1 - x / (W * 0.72)) * 135),
+                int(max(0, (x - W * 0.82) / (W * 0.18)) * 70),
+            )
+            for x in range(W)
+        ),
+    )
+    columna = Image.frombytes("L", (1, H), bytes(int((y / H) * 175) for y in range(H)))
+    alpha = ImageChops.lighter(
+        fila.resize((W, H), Image.Resampling.NEAREST),
+        columna.resize((W, H), Image.Resampling.NEAREST),
+    ).point(lambda a: min(235, a))
+    negro = Image.new("L", (W, H), 0)
+    return Image.merge("RGBA", (negro, negro, negro, alpha))
+
+
 def generar_imagen_evento(
     nombre_local: str,
     nombre_visitante: str,
@@ -150,15 +176,7 @@ def generar_imagen_evento(
     img = img.convert("RGBA")
     img = Image.alpha_composite(img, Image.new("RGBA", (W, H), (0, 0, 0, 78)))
 
-    grad = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-    grad_px = grad.load()
-    for y in range(H):
-        vertical_alpha = int((y / H) * 175)
-        for x in range(W):
-            left_alpha = int(max(0, 1 - x / (W * 0.72)) * 135)
-            edge_alpha = int(max(0, (x - W * 0.82) / (W * 0.18)) * 70)
-            grad_px[x, y] = (0, 0, 0, min(235, max(vertical_alpha, left_alpha, edge_alpha)))
-    img = Image.alpha_composite(img, grad)
+    img = Image.alpha_composite(img, crear_gradiente_evento())
 
     draw = ImageDraw.Draw(img)
     bold_path = next((path for path in FONT_PATHS if path.exists()), None)
@@ -4,6 +4,8 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
@@ -19,12 +21,22 @@ COMMON_HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
 }
+TEXT_HEADERS = {
+    **COMMON_HEADERS,
+    "Accept": "application/xml,text/xml,text/html,*/*;q=0.8",
+}
+IMAGE_HEADERS = {
+    **COMMON_HEADERS,
+    "Referer": "https://football-logos.cc/",
+    "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+}
 BASE_DIR = Path(__file__).resolve().parents[1]
 PROJECT_DIR = Path(__file__).resolve().parents[2]
 if not (PROJECT_DIR / "resources").exists():
     PROJECT_DIR = BASE_DIR
 LOGOS_DIR = PROJECT_DIR / "resources" / "logos_equipos" / "football-logos"
 ALIASES_PATH = PROJECT_DIR / "resources" / "football_logo_aliases.json"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 SITEMAP_NS = {
     "sm": "http://www.sitemaps.org/schemas/sitemap/0.9",
@@ -70,6 +82,8 @@ class CandidatoLogo:
     score: float = 0.0
 
 
+# Los mismos nombres (equipos, países) se normalizan muchas veces por ejecución
+@lru_cache(maxsize=4096)
 def normalizar_texto(texto: str) -> str:
     texto = unicodedata.normalize("NFKD", texto or "")
     texto = "".join(c for c in texto if not unicodedata.combining(c))
@@ -98,39 +112,39 @@ def inferir_paises_preferidos(contexto: str = "") -> tuple[str, ...]:
     return ()
 
 
+@lru_cache(maxsize=8)
+def _opener_con_proxy(proxy_url: str):
+    """El opener con ProxyHandler se construye una vez por proxy, no por petición."""
+    return build_opener(ProxyHandler({"http": proxy_url, "https": proxy_url}))
+
+
 def abrir_url(request: Request, proxy_url: str = ""):
     if not proxy_url:
         return urlopen(request, timeout=45)
 
-    opener = build_opener(ProxyHandler({"http": proxy_url, "https": proxy_url}))
-    return opener.open(request, timeout=45)
+    return _opener_con_proxy(proxy_url).open(request, timeout=45)
 
 
 def descargar_texto(url: str, proxy_url: str = "") -> str:
-    request = Request(
-        url,
-        headers={
-            **COMMON_HEADERS,
-            "Accept": "application/xml,text/xml,text/html,*/*;q=0.8",
-        },
-    )
+    request = Request(url, headers=TEXT_HEADERS)
     with abrir_url(request, proxy_url) as response:
         return response.read().decode("utf-8")
 
 
 def descargar_binario(url: str, proxy_url: str = "") -> bytes:
-    request = Request(
-        url,
-        headers={
-            **COMMON_HEADERS,
-            "Referer": "https://football-logos.cc/",
-            "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        },
-    )
+    request = Request(url, headers=IMAGE_HEADERS)
     with abrir_url(request, proxy_url) as response:
         return response.read()
 
 
+def escribir_binario(ruta: Path, datos: bytes) -> None:
+    """Escribe en un temporal y lo renombra: un corte a medias no deja un PNG truncado en caché."""
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_name(f"{ruta.name}.tmp")
+    temporal.write_bytes(datos)
+    temporal.replace(ruta)
+
+
 def fuente_desde_url(url: str) -> str:
     host = urlparse(url).netloc or "desconocido"
     if "football-logos.cc" in host:
@@ -188,6 +202,15 @@ def calcular_score(
 ) -> float:
     busqueda_normalizada = normalizar_texto(busqueda)
     tokens_busqueda = tokens_relevantes(busqueda)
+    return _puntuar_candidato(busqueda_normalizada, tokens_busqueda, candidato, paises_preferidos)
+
+
+def _puntuar_candidato(
+    busqueda_normalizada: str,
+    tokens_busqueda: set[str],
+    candidato: CandidatoLogo,
+    paises_preferidos: tuple[str, ...] = (),
+) -> float:
     if not busqueda_normalizada or not tokens_busqueda:
         return 0.0
 
@@ -226,19 +249,28 @@ def buscar_candidatos(
     candidatos: list[CandidatoLogo],
     paises_preferidos: tuple[str, ...] = (),
 ) -> list[CandidatoLogo]:
-    puntuados = [
-        CandidatoLogo(
-            c.nombre,
-            c.nombre_normalizado,
-            c.tokens,
-            c.pais,
-            c.pagina_url,
-            c.imagen_url,
-            calcular_score(nombre_equipo, c, paises_preferidos),
-        )
-        for c in candidatos
-    ]
-    return sorted((c for c in puntuados if c.score > 0), key=lambda c: c.score, reverse=True)
+    # La búsqueda se normaliza una sola vez, no una vez por candidato del sitemap
+    busqueda_normalizada = normalizar_texto(nombre_equipo)
+    tokens_busqueda = tokens_relevantes(nombre_equipo)
+    if not busqueda_normalizada or not tokens_busqueda:
+        return []
+
+    puntuados = []
+    for c in candidatos:
+        score = _puntuar_candidato(busqueda_normalizada, tokens_busqueda, c, paises_preferidos)
+        if score > 0:
+            puntuados.append(
+                CandidatoLogo(
+                    c.nombre,
+                    c.nombre_normalizado,
+                    c.tokens,
+                    c.pais,
+                    c.pagina_url,
+                    c.imagen_url,
+                    score,
+                )
+            )
+    return sorted(puntuados, key=attrgetter("score"), reverse=True)
 
 
 def cargar_aliases() -> dict[str, dict[str, str]]:
@@ -259,18 +291,36 @@ def cargar_aliases() -> dict[str, dict[str, str]]:
         return {}
 
 
+def buscar_valor(texto: str, apertura: str, cierre: str = '"') -> str | None:
+    """
+    Primer valor no vacío entre apertura y cierre (sin comillas dentro).
+    Equivale a re.search(apertura + '([^"]+)' + cierre) con find, sin compilar
+    un patrón nuevo por cada página.
+    """
+    pos = texto.find(apertura)
+    while pos != -1:
+        inicio = pos + len(apertura)
+        fin = texto.find('"', inicio)
+        if fin == -1:
+            return None
+        if fin > inicio and texto.startswith(cierre, fin):
+            return texto[inicio:fin]
+        pos = texto.find(apertura, pos + 1)
+    return None
+
+
 def extraer_atributo(html_pagina: str, nombre: str) -> str | None:
-    match = re.search(rf'{nombre}="([^"]+)"', html_pagina)
-    return html.unescape(match.group(1)) if match else None
+    valor = buscar_valor(html_pagina, f'{nombre}="')
+    return html.unescape(valor) if valor else None
 
 
 def resolver_url_descarga(candidato: CandidatoLogo, size: int, proxy_url: str = "") -> str:
     html_pagina = descargar_texto(candidato.pagina_url, proxy_url)
     category_id = extraer_atributo(html_pagina, "data-category-id")
     logo_id = extraer_atributo(html_pagina, "data-logo-id")
-    option = re.search(rf'<option value="{size}::([^"]+)">', html_pagina)
+    option = buscar_valor(html_pagina, f'<option value="{size}::', '">')
     if category_id and logo_id and option:
-        hash_imagen = html.unescape(option.group(1))
+        hash_imagen = html.unescape(option)
         return (
             "https://assets.football-logos.cc/logos/"
             f"{category_id}/{size}x{size}/{logo_id}.{hash_imagen}.png"
@@ -341,15 +391,14 @@ class FootballLogosResolver:
             print(f"⚠️ Error descargando logo '{nombre_equipo}' desde {fuente}: {e}")
             return ""
 
-        if not datos.startswith(b"\x89PNG\r\n\x1a\n"):
+        if not datos.startswith(PNG_SIGNATURE):
             print(
                 f"⚠️ Logo inválido para '{nombre_equipo}' desde "
                 f"{fuente_desde_url(imagen_url)}: {imagen_url}"
             )
             return ""
 
-        salida.parent.mkdir(parents=True, exist_ok=True)
-        salida.write_bytes(datos)
+        escribir_binario(salida, datos)
         salida.with_suffix(".json").write_text(
             json.dumps(
                 {
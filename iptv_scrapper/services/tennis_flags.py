@@ -3,6 +3,7 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
@@ -17,6 +18,7 @@ if not (PROJECT_DIR / "resources").exists():
     PROJECT_DIR = BASE_DIR
 FLAGS_DIR = PROJECT_DIR / "resources" / "flags" / "flagcdn"
 ALIASES_PATH = PROJECT_DIR / "resources" / "tennis_flag_aliases.json"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 
 PAISES_ISO = {
@@ -94,6 +96,8 @@ class BanderaTenis:
     ruta: str
 
 
+# Cada jugador repite su país en todos sus partidos: se normaliza una vez
+@lru_cache(maxsize=4096)
 def normalizar_texto(texto: str) -> str:
     texto = unicodedata.normalize("NFKD", texto or "")
     texto = "".join(c for c in texto if not unicodedata.combining(c))
@@ -142,6 +146,14 @@ def descargar_binario(url: str) -> bytes:
         return response.read()
 
 
+def escribir_binario(ruta: Path, datos: bytes) -> None:
+    """Escritura atómica (temporal + rename) para no dejar banderas a medias."""
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_name(f"{ruta.name}.tmp")
+    temporal.write_bytes(datos)
+    temporal.replace(ruta)
+
+
 def fuente_desde_url(url: str) -> str:
     return urlparse(url).netloc or "desconocido"
 
@@ -165,17 +177,25 @@ class TennisFlagsResolver:
         self.flags_dir = flags_dir
         self.size = size
         self.aliases = cargar_aliases()
+        # Banderas ya comprobadas en esta ejecución: no se vuelve a abrir el PNG
+        self._rutas_validas: set[Path] = set()
 
     def _cache_valida(self, ruta: Path) -> bool:
+        if ruta in self._rutas_validas:
+            return True
         if not ruta.exists() or ruta.stat().st_size <= 0:
             return False
 
         try:
             with Image.open(ruta) as imagen:
-                return imagen.width >= self.size
+                valida = imagen.width >= self.size
         except Exception:
             return False
 
+        if valida:
+            self._rutas_validas.add(ruta)
+        return valida
+
     def resolver_bandera(self, origen_futbolenlatv: str, nombre_jugador: str = "") -> str:
         pais = extraer_pais_desde_url(origen_futbolenlatv)
         iso2 = PAISES_ISO.get(pais) or self.aliases.get(pais)
@@ -202,7 +222,7 @@ class TennisFlagsResolver:
             )
             return ""
 
-        if not datos.startswith(b"\x89PNG\r\n\x1a\n"):
+        if not datos.startswith(PNG_SIGNATURE):
             jugador = f" jugador='{nombre_jugador}'" if nombre_jugador else ""
             print(
                 f"⚠️ Bandera inválida desde {fuente_desde_url(url)} "
@@ -210,10 +230,10 @@ class TennisFlagsResolver:
             )
             return ""
 
-        salida.parent.mkdir(parents=True, exist_ok=True)
-        salida.write_bytes(datos)
+        escribir_binario(salida, datos)
         salida.with_suffix(".txt").write_text(
             f"source=https://flagcdn.com\niso2={iso2}\npais={pais}\nupdated_at={datetime.now().isoformat(timespec='seconds')}\n",
             encoding="utf-8",
         )
+        self._rutas_validas.add(salida)
         return str(salida)
@@ -10,8 +10,11 @@ import sys
 import time
 import traceback
 import unicodedata
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 
 import requests
 
@@ -58,8 +61,19 @@ LANGUAGE_ALIASES = {
     "SUB": "SUB",
     "SUBTITULADO": "SUB",
 }
+# Alias de cada idioma normalizado (incluido él mismo), de más largo a más corto
+LANGUAGE_VARIANTS = {
+    language: tuple(
+        sorted(
+            {key for key, value in LANGUAGE_ALIASES.items() if value == language} | {language},
+            key=lambda variant: (-len(variant), variant),
+        )
+    )
+    for language in set(LANGUAGE_ALIASES.values())
+}
 FILTER_LANGUAGES_NORMALIZED = {"EN", "ES", "LATAM"}
 CATALOG_COUNTRIES_ALLOWED = {"EN", "ES"}
+CATALOG_CONTENT_TYPES = frozenset({CONSTANTS.CONTENT_TYPE_MOVIE, CONSTANTS.CONTENT_TYPE_SERIE})
 LANGUAGE_TOKEN_REGEX = re.compile(
     r"(?i)(?<![A-Z0-9])(LATAM|LATINO|LAT|LA|ENGLISH|ENG|EN|ESPANOL|SPANISH|ESP|ES|VOSE|CASTELLANO|CAST|SUBTITULADO|SUB)(?![A-Z0-9])"
 )
@@ -69,13 +83,15 @@ def contains_language(extinf_line: str) -> bool:
     """
     Busca idioma en group-title, tvg-name o display name.
     """
-    metadata = extraer_metadatos_normalizados_m3u(extinf_line)
-    return metadata["language"] in FILTER_LANGUAGES_NORMALIZED
+    # Solo hace falta el idioma: no se normalizan nombre ni grupo
+    group_title, source_name = extraer_grupo_y_nombre_m3u(extinf_line)
+    language = extraer_idioma_desde_grupo(group_title) or extraer_idioma_desde_nombre(source_name)
+    return language in FILTER_LANGUAGES_NORMALIZED
 
 
 def debe_guardarse_en_catalogo(item: dict, tipo: str) -> bool:
     """Determina si una película o serie debe guardarse en el catálogo."""
-    if tipo not in {CONSTANTS.CONTENT_TYPE_MOVIE, CONSTANTS.CONTENT_TYPE_SERIE}:
+    if tipo not in CATALOG_CONTENT_TYPES:
         return True
 
     country = extraer_country(item.get("group", ""))
@@ -106,6 +122,25 @@ def split_extinf_line(extinf_line: str) -> tuple[str, str]:
     return extinf_line[:comma_index], extinf_line[comma_index + 1 :].strip()
 
 
+def iterar_lineas_m3u(contenido: str):
+    """
+    Recorre las líneas del M3U sin materializar la lista de split("\n"),
+    que con playlists de cientos de MB duplica el pico de memoria.
+    """
+    inicio = 0
+    while True:
+        fin = contenido.find("\n", inicio)
+        if fin == -1:
+            yield contenido[inicio:]
+            return
+        yield contenido[inicio:fin]
+        inicio = fin + 1
+
+
+# Los group-title se repiten en miles de entradas: lo derivado de ellos se cachea
+GROUP_CACHE_SIZE = 4096
+
+
 def normalizar_idioma(raw_value: str | None) -> str | None:
     if not raw_value:
         return None
@@ -114,6 +149,7 @@ def normalizar_idioma(raw_value: str | None) -> str | None:
     return LANGUAGE_ALIASES.get(cleaned)
 
 
+@lru_cache(maxsize=GROUP_CACHE_SIZE)
 def extraer_idioma_desde_grupo(group_title: str) -> str | None:
     if not group_title:
         return None
@@ -150,6 +186,28 @@ def extraer_idioma_desde_nombre(name: str) -> str | None:
     return None
 
 
+@lru_cache
+def _regex_prefijo_idioma(language: str) -> re.Pattern:
+    """Compila una vez por idioma el patrón del prefijo (ES - , LATINO | , ...)."""
+    variants = LANGUAGE_VARIANTS.get(language, (language,))
+    return re.compile(
+        r"^\s*(?:" + "|".join(re.escape(v) for v in variants) + r")\s*[-|:]\s*",
+        re.IGNORECASE,
+    )
+
+
+@lru_cache
+def _regexes_grupo_idioma(language: str) -> tuple[tuple[re.Pattern, re.Pattern], ...]:
+    """Por cada variante del idioma: (|VARIANTE| dentro del grupo, VARIANTE - al inicio)."""
+    return tuple(
+        (
+            re.compile(rf"\|\s*{re.escape(variant)}\s*\|", re.IGNORECASE),
+            re.compile(rf"^\s*{re.escape(variant)}\s*[-|:]\s*", re.IGNORECASE),
+        )
+        for variant in LANGUAGE_VARIANTS.get(language, (language,))
+    )
+
+
 def quitar_prefijo_idioma(texto: str, language: str | None) -> str:
     if not texto:
         return ""
@@ -158,14 +216,7 @@ def quitar_prefijo_idioma(texto: str, language: str | None) -> str:
     if not language:
         return cleaned
 
-    variants = [key for key, value in LANGUAGE_ALIASES.items() if value == language]
-    variants.append(language)
-    pattern = (
-        r"^\s*(?:"
-        + "|".join(sorted(set(re.escape(v) for v in variants), key=len, reverse=True))
-        + r")\s*[-|:]\s*"
-    )
-    return re.sub(pattern, "", cleaned, count=1, flags=re.IGNORECASE).strip()
+    return _regex_prefijo_idioma(language).sub("", cleaned, count=1).strip()
 
 
 QUALITY_TOKENS = ("UHD", "FHD", "HD", "SD", "4K", "HEVC", "H265", "HQ", "LQ")
@@ -173,6 +224,14 @@ QUALITY_REGEX = re.compile(
     rf"(?:[\[\(]\s*({'|'.join(QUALITY_TOKENS)})\s*[\]\)]\b|\b({'|'.join(QUALITY_TOKENS)})\b)",
     re.IGNORECASE,
 )
+QUALITY_TAG_REGEX = re.compile(
+    rf"\s*[\[\(]\s*({'|'.join(QUALITY_TOKENS)})\s*[\]\)]\s*", re.IGNORECASE
+)
+QUALITY_WORD_REGEX = re.compile(rf"\b({'|'.join(QUALITY_TOKENS)})\b", re.IGNORECASE)
+EMPTY_SQUARE_BRACKETS_REGEX = re.compile(r"\s*\[\s*\]\s*")
+EMPTY_PARENS_REGEX = re.compile(r"\s*\(\s*\)\s*")
+WHITESPACE_REGEX = re.compile(r"\s+")
+REPEATED_PIPES_REGEX = re.compile(r"\|+")
 
 
 def extraer_calidad(nombre: str) -> str | None:
@@ -191,16 +250,11 @@ def limpiar_etiquetas_calidad(texto: str) -> str:
     if not texto:
         return ""
 
-    cleaned = re.sub(
-        r"\s*[\[\(]\s*(UHD|FHD|HD|SD|4K|HEVC|H265|HQ|LQ)\s*[\]\)]\s*",
-        " ",
-        texto,
-        flags=re.IGNORECASE,
-    )
-    cleaned = re.sub(r"\b(UHD|FHD|HD|SD|4K|HEVC|H265|HQ|LQ)\b", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*\[\s*\]\s*", " ", cleaned)
-    cleaned = re.sub(r"\s*\(\s*\)\s*", " ", cleaned)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = QUALITY_TAG_REGEX.sub(" ", texto)
+    cleaned = QUALITY_WORD_REGEX.sub("", cleaned)
+    cleaned = EMPTY_SQUARE_BRACKETS_REGEX.sub(" ", cleaned)
+    cleaned = EMPTY_PARENS_REGEX.sub(" ", cleaned)
+    return WHITESPACE_REGEX.sub(" ", cleaned).strip()
 
 
 def extraer_año(nombre: str) -> int | None:
@@ -214,23 +268,20 @@ def extraer_año(nombre: str) -> int | None:
     return None
 
 
+@lru_cache(maxsize=GROUP_CACHE_SIZE)
 def normalizar_grupo(group_title: str, language: str | None) -> str:
     if not group_title:
         return ""
 
     cleaned = group_title.strip()
     if language:
-        variants = [key for key, value in LANGUAGE_ALIASES.items() if value == language]
-        variants.append(language)
-        for variant in sorted(set(variants), key=len, reverse=True):
-            cleaned = re.sub(rf"\|\s*{re.escape(variant)}\s*\|", "|", cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(
-                rf"^\s*{re.escape(variant)}\s*[-|:]\s*", "", cleaned, flags=re.IGNORECASE
-            )
+        for pipe_regex, prefix_regex in _regexes_grupo_idioma(language):
+            cleaned = pipe_regex.sub("|", cleaned)
+            cleaned = prefix_regex.sub("", cleaned)
 
-    cleaned = re.sub(r"\|+", "|", cleaned)
+    cleaned = REPEATED_PIPES_REGEX.sub("|", cleaned)
     cleaned = cleaned.strip(" |-_")
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return WHITESPACE_REGEX.sub(" ", cleaned).strip()
 
 
 def extraer_serie_name_normalizado(nombre_normalizado: str) -> str | None:
@@ -259,37 +310,51 @@ def construir_metadatos_normalizados(name: str, group_title: str, content_type:
     }
 
 
+DEDUP_SHORT_BRACKETS_REGEX = re.compile(r"\[[^\]]{1,15}\]")
+DEDUP_SHORT_PARENS_REGEX = re.compile(r"\([^)]{1,15}\)")
+DEDUP_EPISODE_SUFFIX_REGEX = re.compile(r"\s+[sS]\d+\s+[eE]\d+.*$")
+DEDUP_NON_ALNUM_REGEX = re.compile(r"[^a-z0-9\s]")
+
+
 def _compute_dedup_key(text: str) -> str:
     if not text:
         return ""
-    result = text
     # Quitar corchetes con contenido ≤15 chars
-    result = re.sub(r"\[[^\]]{1,15}\]", "", result)
+    result = DEDUP_SHORT_BRACKETS_REGEX.sub("", text)
     result = result.replace("[", "").replace("]", "")
     # Quitar paréntesis con contenido ≤15 chars
-    result = re.sub(r"\([^)]{1,15}\)", "", result)
+    result = DEDUP_SHORT_PARENS_REGEX.sub("", result)
     result = result.replace("(", "").replace(")", "")
     # Quitar apóstrofes
-    result = result.replace("'", "").replace("'", "").replace("'", "")
+    result = result.replace("'", "")
     # Quitar patrones de temporada/episodio (SXX EXX) para series
-    result = re.sub(r"\s+[sS]\d+\s+[eE]\d+.*$", "", result)
+    result = DEDUP_EPISODE_SUFFIX_REGEX.sub("", result)
     # Lowercase + quitar acentos
     result = unicodedata.normalize("NFKD", result).encode("ascii", "ignore").decode("ascii").lower()
     # Quitar caracteres especiales excepto espacios y dígitos
-    result = re.sub(r"[^a-z0-9\s]", "", result)
-    result = re.sub(r"\s+", " ", result).strip()
-    return result
+    result = DEDUP_NON_ALNUM_REGEX.sub("", result)
+    return WHITESPACE_REGEX.sub(" ", result).strip()
 
 
-def extraer_metadatos_normalizados_m3u(extinf_line: str) -> dict:
-    attrs_part, display_name = split_extinf_line(extinf_line)
-    group_match = re.search(r'group-title="([^"]+)"', attrs_part)
-    tvg_name_match = re.search(r'tvg-name="([^"]+)"', attrs_part)
+GROUP_TITLE_REGEX = re.compile(r'group-title="([^"]+)"')
+TVG_NAME_REGEX = re.compile(r'tvg-name="([^"]+)"')
 
+
+def extraer_grupo_y_nombre_m3u(extinf_line: str) -> tuple[str, str]:
+    """Devuelve (group_title, nombre) de una línea #EXTINF; el nombre cae a tvg-name."""
+    attrs_part, display_name = split_extinf_line(extinf_line)
+    group_match = GROUP_TITLE_REGEX.search(attrs_part)
     group_title = group_match.group(1).strip() if group_match else ""
-    tvg_name = tvg_name_match.group(1).strip() if tvg_name_match else ""
 
-    source_name = display_name or tvg_name
+    if display_name:
+        return group_title, display_name
+
+    tvg_name_match = TVG_NAME_REGEX.search(attrs_part)
+    return group_title, tvg_name_match.group(1).strip() if tvg_name_match else ""
+
+
+def extraer_metadatos_normalizados_m3u(extinf_line: str) -> dict:
+    group_title, source_name = extraer_grupo_y_nombre_m3u(extinf_line)
     return construir_metadatos_normalizados(source_name, group_title, CONSTANTS.CONTENT_TYPE_MOVIE)
 
 
@@ -322,16 +387,14 @@ def enriquecer_extinf_con_metadatos(extinf_line: str, content_type: str = None)
     return f"{attrs_part}{''.join(extra_attrs)},{display_name}"
 
 
-async def obtener_config_desde_postgres(key: str) -> str:
-    """Obtiene un valor de la tabla config. F3c2a: pool param removed."""
+async def obtener_configs_desde_postgres(*keys: str) -> dict[str, str]:
+    """Obtiene varios valores de la tabla config en una sola consulta ("" si no existen)."""
     session_factory = DatabasePG.get_session_factory()
     async with session_factory() as session:
-        stmt = select(Config.value).where(Config.key == key)
+        stmt = select(Config.key, Config.value).where(Config.key.in_(keys))
         result = await session.execute(stmt)
-        value = result.scalar()
-        if value:
-            return str(value)
-    return ""
+        valores = {row.key: str(row.value) for row in result if row.value}
+    return {key: valores.get(key, "") for key in keys}
 
 
 def construir_proxies_requests(
@@ -352,16 +415,18 @@ def construir_proxies_requests(
     }
 
 
+SERIES_REGEX = re.compile(CONSTANTS.SERIES_PATTERN, re.IGNORECASE)
+
+
 def detectar_tipo_contenido(url, nombre):
     """
     Detecta si es canal, película o serie basándose en la URL y nombre
     Returns: 'channel', 'movie' o 'serie'
     """
     url_lower = url.lower()
-    nombre_lower = nombre.lower()
 
-    # Detectar series
-    if CONSTANTS.URL_SERIES_PATH in url_lower or re.search(CONSTANTS.SERIES_PATTERN, nombre_lower):
+    # Detectar series (SERIES_REGEX ya acepta S/s y E/e: no hace falta bajar el nombre)
+    if CONSTANTS.URL_SERIES_PATH in url_lower or SERIES_REGEX.search(nombre):
         return CONSTANTS.CONTENT_TYPE_SERIE
 
     # Detectar películas
@@ -372,6 +437,10 @@ def detectar_tipo_contenido(url, nombre):
     return CONSTANTS.CONTENT_TYPE_CHANNEL
 
 
+TMDB_W185_PREFIX = "https://image.tmdb.org/t/p/w185/"
+TMDB_SERIES_PREFIX = "https://image.tmdb.org/t/p/w600_and_h900_bestv2/"
+
+
 def proxy_logo_url(logo_url: str, public_domain: str, content_type: str = "channel") -> str:
     """
     Convierte URLs de logos HTTP a HTTPS usando el proxy.
@@ -385,19 +454,14 @@ def proxy_logo_url(logo_url: str, public_domain: str, content_type: str = "chann
     Returns:
         URL transformada usando el proxy HTTPS, o placeholder local
     """
-    from urllib.parse import quote
-
     if not logo_url:
         return f"{public_domain}/placeholder/{content_type}.png"
 
-    tmdb_w185_prefix = "https://image.tmdb.org/t/p/w185/"
-    tmdb_series_prefix = "https://image.tmdb.org/t/p/w600_and_h900_bestv2/"
-
-    if content_type == CONSTANTS.CONTENT_TYPE_SERIE and logo_url.startswith(tmdb_w185_prefix):
-        return logo_url.replace(tmdb_w185_prefix, tmdb_series_prefix, 1)
+    if content_type == CONSTANTS.CONTENT_TYPE_SERIE and logo_url.startswith(TMDB_W185_PREFIX):
+        return TMDB_SERIES_PREFIX + logo_url[len(TMDB_W185_PREFIX) :]
 
     # Si ya es HTTPS o es una URL local, dejarla como está
-    if logo_url.startswith("https://") or logo_url.startswith("/"):
+    if logo_url.startswith(("https://", "/")):
         return logo_url
 
     # Convertir HTTP a HTTPS usando el proxy con query string
@@ -413,7 +477,7 @@ def extraer_temporada_episodio(nombre):
         - "Serie S2 E10" -> ('2', '10')
     Returns: (temporada, episodio) o (None, None)
     """
-    match = re.search(CONSTANTS.SERIES_PATTERN, nombre, re.IGNORECASE)
+    match = SERIES_REGEX.search(nombre)
     if match:
         temporada = match.group(1).zfill(2)
         episodio = match.group(2).zfill(2)
@@ -458,6 +522,7 @@ COUNTRY_KEYWORDS = {
 }
 
 
+@lru_cache(maxsize=GROUP_CACHE_SIZE)
 def extraer_country(grupo):
     """
     Extrae el código de país del grupo
@@ -669,7 +734,7 @@ def crear_template_m3u(contenido_m3u: str, provider_url: str) -> dict:
             - 'series': solo series filtradas
             - 'counts': contador por tipo
     """
-    lines = contenido_m3u.split("\n")
+    lines = iterar_lineas_m3u(contenido_m3u)
 
     all_lines = ["#EXTM3U"]
     live_lines = ["#EXTM3U"]
@@ -710,21 +775,23 @@ def crear_template_m3u(contenido_m3u: str, provider_url: str) -> dict:
             continue
 
         content_type = None
-        processed_line = line
 
-        if pattern_series.search(line):
-            processed_line = pattern_series.sub(
-                r"{{DOMAIN}}/series/{{USERNAME}}/{{PASSWORD}}/\1.\2", line
-            )
+        # subn busca y sustituye en una sola pasada; n indica si hubo coincidencia
+        processed_line, n = pattern_series.subn(
+            r"{{DOMAIN}}/series/{{USERNAME}}/{{PASSWORD}}/\1.\2", line
+        )
+        if n:
             content_type = "series"
-        elif pattern_movie.search(line):
-            processed_line = pattern_movie.sub(
+        else:
+            processed_line, n = pattern_movie.subn(
                 r"{{DOMAIN}}/movie/{{USERNAME}}/{{PASSWORD}}/\1.\2", line
             )
-            content_type = "movie"
-        elif pattern_live.search(line):
-            processed_line = pattern_live.sub(replace_live_url, line)
-            content_type = "live"
+            if n:
+                content_type = "movie"
+            else:
+                processed_line, n = pattern_live.subn(replace_live_url, line)
+                if n:
+                    content_type = "live"
 
         all_lines.append(processed_line)
 
@@ -818,10 +885,10 @@ def guardar_m3u_local(contenido_m3u: str, m3u_dir: str = None, provider_url: str
             ("Movie", "movie"),
             ("Series", "series"),
         ]:
-            content = templates[key]
-            size_mb = len(content.encode("utf-8")) / 1024 / 1024
             filename = f"playlist_template_{key}.m3u" if key != "full" else "playlist_template.m3u"
-            path = write_atomic(content, filename)
+            path = write_atomic(templates[key], filename)
+            # Tamaño desde disco: evita codificar una copia completa del template en memoria
+            size_mb = os.path.getsize(path) / 1024 / 1024
             results[key] = {"path": path, "filename": filename, "size_mb": size_mb}
             print(f"    ✅ {name}: {filename} ({size_mb:.2f} MB)")
 
@@ -864,6 +931,30 @@ async def limpiar_tabla_optimizada(tabla: str) -> bool:
         return False
 
 
+CHANNEL_UPSERT_SQL = text("""
+    INSERT INTO channels
+        (id, numero, nombre, logo, url, grupo, country, tvg_id,
+         nombre_normalizado, grupo_normalizado, stream_url, provider_id,
+         last_sync_at)
+    VALUES (:id, :numero, :nombre, :logo, :url, :grupo, :country, :tvg_id,
+         :nombre_normalizado, :grupo_normalizado, :stream_url, :provider_id,
+         :last_sync_at)
+    ON CONFLICT (id) DO UPDATE SET
+        numero = EXCLUDED.numero,
+        nombre = EXCLUDED.nombre,
+        logo = COALESCE(EXCLUDED.logo, channels.logo),
+        url = EXCLUDED.url,
+        grupo = EXCLUDED.grupo,
+        country = EXCLUDED.country,
+        tvg_id = EXCLUDED.tvg_id,
+        nombre_normalizado = EXCLUDED.nombre_normalizado,
+        grupo_normalizado = EXCLUDED.grupo_normalizado,
+        stream_url = EXCLUDED.stream_url,
+        provider_id = EXCLUDED.provider_id,
+        last_sync_at = EXCLUDED.last_sync_at
+""")
+
+
 async def insert_channels_upsert(channels: list) -> bool:
     """Inserta o actualiza canales usando upsert. F3c2b: migrado a iptv-db."""
     if not channels:
@@ -876,54 +967,31 @@ async def insert_channels_upsert(channels: list) -> bool:
         async with session_factory() as session:
             sync_start = datetime.now()
 
-            for c in channels:
-                channel_id = c.get("id") or ""
-                if not channel_id:
-                    continue
-
-                try:
-                    await session.execute(
-                        text("""
-                            INSERT INTO channels
-                                (id, numero, nombre, logo, url, grupo, country, tvg_id,
-                                 nombre_normalizado, grupo_normalizado, stream_url, provider_id,
-                                 last_sync_at)
-                            VALUES (:id, :numero, :nombre, :logo, :url, :grupo, :country, :tvg_id,
-                                 :nombre_normalizado, :grupo_normalizado, :stream_url, :provider_id,
-                                 :last_sync_at)
-                            ON CONFLICT (id) DO UPDATE SET
-                                numero = EXCLUDED.numero,
-                                nombre = EXCLUDED.nombre,
-                                logo = COALESCE(EXCLUDED.logo, channels.logo),
-                                url = EXCLUDED.url,
-                                grupo = EXCLUDED.grupo,
-                                country = EXCLUDED.country,
-                                tvg_id = EXCLUDED.tvg_id,
-                                nombre_normalizado = EXCLUDED.nombre_normalizado,
-                                grupo_normalizado = EXCLUDED.grupo_normalizado,
-                                stream_url = EXCLUDED.stream_url,
-                                provider_id = EXCLUDED.provider_id,
-                                last_sync_at = EXCLUDED.last_sync_at
-                        """),
-                        {
-                            "id": channel_id,
-                            "numero": c.get("numero", 0),
-                            "nombre": c.get("nombre", ""),
-                            "logo": c.get("logo"),
-                            "url": c.get("url", ""),
-                            "grupo": c.get("grupo"),
-                            "country": c.get("country"),
-                            "tvg_id": c.get("tvg_id", ""),
-                            "nombre_normalizado": c.get("nombre_normalizado"),
-                            "grupo_normalizado": c.get("grupo_normalizado"),
-                            "stream_url": c.get("stream_url", ""),
-                            "provider_id": c.get("provider_id"),
-                            "last_sync_at": sync_start,
-                        },
-                    )
-                except Exception as e:
-                    print(f"  ⚠️  Error insertando canal '{c.get('nombre')}': {e}")
-                    continue
+            params = [
+                {
+                    "id": c["id"],
+                    "numero": c.get("numero", 0),
+                    "nombre": c.get("nombre", ""),
+                    "logo": c.get("logo"),
+                    "url": c.get("url", ""),
+                    "grupo": c.get("grupo"),
+                    "country": c.get("country"),
+                    "tvg_id": c.get("tvg_id", ""),
+                    "nombre_normalizado": c.get("nombre_normalizado"),
+                    "grupo_normalizado": c.get("grupo_normalizado"),
+                    "stream_url": c.get("stream_url", ""),
+                    "provider_id": c.get("provider_id"),
+                    "last_sync_at": sync_start,
+                }
+                for c in channels
+                if c.get("id")
+            ]
+
+            # executemany por lotes: un viaje por lote en lugar de uno por canal
+            for i in range(0, len(params), CONSTANTS.DB_DEFAULT_BATCH_SIZE):
+                await session.execute(
+                    CHANNEL_UPSERT_SQL, params[i : i + CONSTANTS.DB_DEFAULT_BATCH_SIZE]
+                )
 
             # Limpiar canales que desaparecieron del M3U
             result = await session.execute(
@@ -1383,38 +1451,52 @@ async def insert_series_catalog(series: list) -> bool:
         return False
 
 
+def extraer_atributo_extinf(line: str, attr: str) -> str:
+    """
+    Valor de un atributo (attr incluye la comilla de apertura, p.ej. 'tvg-id="').
+    Localiza por posición en vez de partir la línea entera con split.
+    """
+    inicio = line.find(attr)
+    if inicio == -1:
+        return ""
+    inicio += len(attr)
+    fin = line.find('"', inicio)
+    return line[inicio:] if fin == -1 else line[inicio:fin]
+
+
 def parsear_m3u(m3u_content: str) -> list:
     """Parsea contenido M3U y retorna lista de items"""
     items_temp = []
-    lines = m3u_content.split("\n")
-    current_item = {}
+    lines = iterar_lineas_m3u(m3u_content)
+    # Datos del último #EXTINF; el dict del item se crea una sola vez, al llegar la URL
+    pendiente = None
 
     for line in lines:
         line = line.strip()
 
         if line.startswith(CONSTANTS.M3U_EXTINF_PREFIX):
             # Extraer información del item
-            group = ""
-            if CONSTANTS.M3U_GROUP_TITLE_ATTR in line:
-                group = line.split(CONSTANTS.M3U_GROUP_TITLE_ATTR)[1].split('"')[0]
+            # Hay pocos grupos distintos: compartir una sola instancia por valor
+            group = sys.intern(extraer_atributo_extinf(line, CONSTANTS.M3U_GROUP_TITLE_ATTR))
 
-            name = line.split(",")[-1].strip() if "," in line else "Unknown"
+            coma = line.rfind(",")
+            name = line[coma + 1 :].strip() if coma != -1 else "Unknown"
 
             logo = ""
             if CONSTANTS.M3U_TVG_LOGO_ATTR in line:
-                raw_logo = line.split(CONSTANTS.M3U_TVG_LOGO_ATTR)[1].split('"')[0]
+                raw_logo = extraer_atributo_extinf(line, CONSTANTS.M3U_TVG_LOGO_ATTR)
                 logo = proxy_logo_url(raw_logo, settings.public_domain, "channel")
 
-            tvg_id = ""
-            if CONSTANTS.M3U_TVG_ID_ATTR in line:
-                tvg_id = line.split(CONSTANTS.M3U_TVG_ID_ATTR)[1].split('"')[0]
+            tvg_id = extraer_atributo_extinf(line, CONSTANTS.M3U_TVG_ID_ATTR)
 
-            current_item = {"name": name, "group": group, "logo": logo, "tvg_id": tvg_id}
+            pendiente = (name, group, logo, tvg_id)
 
-        elif line and not line.startswith("#") and current_item:
-            current_item["url"] = line
-            items_temp.append(current_item.copy())
-            current_item = {}
+        elif line and not line.startswith("#") and pendiente:
+            name, group, logo, tvg_id = pendiente
+            items_temp.append(
+                {"name": name, "group": group, "logo": logo, "tvg_id": tvg_id, "url": line}
+            )
+            pendiente = None
 
     return items_temp
 
@@ -1443,19 +1525,24 @@ async def sync_to_postgres():
     download_proxies: dict[str, str] | None = None
 
     try:
-        provider_url = await obtener_config_desde_postgres("IPTV_BASE_URL")
-        provider_username = await obtener_config_desde_postgres("IPTV_USERNAME")
-        provider_password = await obtener_config_desde_postgres("IPTV_PASSWORD")
-
-        proxy_ip = await obtener_config_desde_postgres("PROXY_IP")
-        proxy_port = await obtener_config_desde_postgres("PROXY_PORT")
-        proxy_user = await obtener_config_desde_postgres("PROXY_USER")
-        proxy_pass = await obtener_config_desde_postgres("PROXY_PASS")
+        config = await obtener_configs_desde_postgres(
+            "IPTV_BASE_URL",
+            "IPTV_USERNAME",
+            "IPTV_PASSWORD",
+            "PROXY_IP",
+            "PROXY_PORT",
+            "PROXY_USER",
+            "PROXY_PASS",
+        )
+        provider_url = config["IPTV_BASE_URL"]
+        provider_username = config["IPTV_USERNAME"]
+        provider_password = config["IPTV_PASSWORD"]
+
         download_proxies = construir_proxies_requests(
-            proxy_ip,
-            proxy_port,
-            proxy_user,
-            proxy_pass,
+            config["PROXY_IP"],
+            config["PROXY_PORT"],
+            config["PROXY_USER"],
+            config["PROXY_PASS"],
         )
 
         if provider_url and provider_username and provider_password:
@@ -1465,7 +1552,9 @@ async def sync_to_postgres():
             print(f"   URL Base: {provider_url}")
             print(f"   Username: {provider_username}")
             if download_proxies:
-                print(f"✅ Proxy configurado desde config: {proxy_ip}:{proxy_port}")
+                print(
+                    f"✅ Proxy configurado desde config: {config['PROXY_IP']}:{config['PROXY_PORT']}"
+                )
             else:
                 print("⚠️  Proxy no configurado en config; descarga directa")
         else:
@@ -1496,7 +1585,9 @@ async def sync_to_postgres():
                 url, timeout=CONSTANTS.PLAYLIST_DOWNLOAD_TIMEOUT, proxies=download_proxies
             )
             response.raise_for_status()
-            m3u_content = response.text
+            # Sin charset en la cabecera, response.text detecta la codificación
+            # recorriendo toda la playlist; las M3U del proveedor son UTF-8
+            m3u_content = response.content.decode(response.encoding or "utf-8", errors="replace")
             fin_descarga = time.time()
             duracion_descarga = fin_descarga - inicio_descarga
             print(f"✅ Playlist descargada: {len(m3u_content):,} caracteres")
@@ -1515,7 +1606,7 @@ async def sync_to_postgres():
                 return 1
             if retry_count < MAX_RETRIES:
                 print(f"⚠️  Error HTTP (intento {retry_count}/{MAX_RETRIES}): {e}")
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
                 print(f"❌ Error HTTP después de {MAX_RETRIES} intentos: {e}")
                 return 1
@@ -1523,7 +1614,7 @@ async def sync_to_postgres():
             retry_count += 1
             if retry_count < MAX_RETRIES:
                 print(f"⚠️  Error de conexión (intento {retry_count}/{MAX_RETRIES}): {e}")
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
                 print(f"❌ Error de conexión después de {MAX_RETRIES} intentos: {e}")
                 return 1
@@ -1547,55 +1638,45 @@ async def sync_to_postgres():
     movies = []
     series = []
 
-    stats = {
-        "channels": {"total": 0, "con_logo": 0, "sin_logo": 0},
-        "movies": {"total": 0, "con_logo": 0, "sin_logo": 0, "filtradas": 0},
-        "series": {"total": 0, "con_logo": 0, "sin_logo": 0, "filtradas": 0},
-    }
-
     print("\n🔍 FASE 3: Clasificando contenido por tipo...")
     inicio_clasificacion = time.time()
 
-    idx_channel = 1
-    idx_movie = 1
-    idx_serie = 1
+    # Contadores planos por tipo; el resumen anidado se arma una vez al final
+    con_logo = Counter()
+    filtradas = Counter()
 
     for item in items_temp:
         tipo = detectar_tipo_contenido(item["url"], item["name"])
 
         if tipo == CONSTANTS.CONTENT_TYPE_CHANNEL:
-            item_data = procesar_item(item, idx_channel, tipo, provider_username, provider_password)
-            channels.append(item_data)
-            idx_channel += 1
-            stats["channels"]["total"] += 1
-            if item["logo"]:
-                stats["channels"]["con_logo"] += 1
-            else:
-                stats["channels"]["sin_logo"] += 1
-        elif tipo == CONSTANTS.CONTENT_TYPE_MOVIE:
-            if not debe_guardarse_en_catalogo(item, tipo):
-                stats["movies"]["filtradas"] += 1
-                continue
-            item_data = procesar_item(item, idx_movie, tipo, provider_username, provider_password)
-            movies.append(item_data)
-            idx_movie += 1
-            stats["movies"]["total"] += 1
-            if item["logo"]:
-                stats["movies"]["con_logo"] += 1
-            else:
-                stats["movies"]["sin_logo"] += 1
-        elif tipo == CONSTANTS.CONTENT_TYPE_SERIE:
+            destino = channels
+        elif tipo in (CONSTANTS.CONTENT_TYPE_MOVIE, CONSTANTS.CONTENT_TYPE_SERIE):
             if not debe_guardarse_en_catalogo(item, tipo):
-                stats["series"]["filtradas"] += 1
+                filtradas[tipo] += 1
                 continue
-            item_data = procesar_item(item, idx_serie, tipo, provider_username, provider_password)
-            series.append(item_data)
-            idx_serie += 1
-            stats["series"]["total"] += 1
-            if item["logo"]:
-                stats["series"]["con_logo"] += 1
-            else:
-                stats["series"]["sin_logo"] += 1
+            destino = movies if tipo == CONSTANTS.CONTENT_TYPE_MOVIE else series
+        else:
+            continue
+
+        destino.append(
+            procesar_item(item, len(destino) + 1, tipo, provider_username, provider_password)
+        )
+        if item["logo"]:
+            con_logo[tipo] += 1
+
+    def _resumen(tipo: str, items: list) -> dict:
+        return {
+            "total": len(items),
+            "con_logo": con_logo[tipo],
+            "sin_logo": len(items) - con_logo[tipo],
+            "filtradas": filtradas[tipo],
+        }
+
+    stats = {
+        "channels": _resumen(CONSTANTS.CONTENT_TYPE_CHANNEL, channels),
+        "movies": _resumen(CONSTANTS.CONTENT_TYPE_MOVIE, movies),
+        "series": _resumen(CONSTANTS.CONTENT_TYPE_SERIE, series),
+    }
 
     fin_clasificacion = time.time()
     duracion_clasificacion = fin_clasificacion - inicio_clasificacion
@@ -1608,11 +1689,20 @@ async def sync_to_postgres():
     print(f"  📺 Series: {stats['series']['total']:,}")
 
     print("\n🔍 Verificando estado de la base de datos...")
-    count_channels_db = await contar_registros_tabla(CONSTANTS.CHANNELS_TABLE)
-    count_movie_streams_db = await contar_registros_tabla(CONSTANTS.MOVIE_STREAMS_TABLE)
-    count_series_streams_db = await contar_registros_tabla(CONSTANTS.SERIES_STREAMS_TABLE)
-    count_movies_catalog_db = await contar_registros_tabla(CONSTANTS.MOVIES_CATALOG_TABLE)
-    count_series_catalog_db = await contar_registros_tabla(CONSTANTS.SERIES_CATALOG_TABLE)
+    # Cada conteo abre su propia sesión: se lanzan en paralelo
+    (
+        count_channels_db,
+        count_movie_streams_db,
+        count_series_streams_db,
+        count_movies_catalog_db,
+        count_series_catalog_db,
+    ) = await asyncio.gather(
+        contar_registros_tabla(CONSTANTS.CHANNELS_TABLE),
+        contar_registros_tabla(CONSTANTS.MOVIE_STREAMS_TABLE),
+        contar_registros_tabla(CONSTANTS.SERIES_STREAMS_TABLE),
+        contar_registros_tabla(CONSTANTS.MOVIES_CATALOG_TABLE),
+        contar_registros_tabla(CONSTANTS.SERIES_CATALOG_TABLE),
+    )
 
     print("  📊 Estado actual en BD:")
     print(f"    - Canales: {count_channels_db:,}")
@@ -11,6 +11,7 @@ import subprocess
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -73,6 +74,22 @@ class WatchWrestlingUfcScraper:
             "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
         )
     }
+    # Sondeo de streams: un byte basta para saber si responde
+    PROBE_HEADERS = {**DEFAULT_HEADERS, "Range": "bytes=0-0"}
+
+    # Patrones del m3u8 en el embed de VidFrame, sobre bytes para no decodificar el HTML
+    VIDFRAME_M3U8_PATTERNS = (
+        re.compile(rb'file:\s*"([^"]+\.m3u8[^"]*)"'),
+        re.compile(rb"file:\s*'([^']+\.m3u8[^']*)'"),
+    )
+
+    # Dominios propios: sus enlaces no son embeds de terceros
+    SITE_DOMAINS = frozenset({"dailywrestling.cc", "watch-wrestling.eu"})
+
+    # Patrones de texto precompilados (se usan por cada evento y enlace)
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+    UFC_NUMERADO_PATTERN = re.compile(r"\bUFC\s+\d+\b")
+    FECHA_TITULO_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")
 
     # Workers para resolución HTTP en paralelo
     HTTP_BATCH_WORKERS = 8
@@ -331,19 +348,19 @@ class WatchWrestlingUfcScraper:
     # HTML helpers
     # ──────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _html_to_text(html: str) -> str:
+    @classmethod
+    def _html_to_text(cls, html: str) -> str:
         if not html:
             return ""
         texto = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        return re.sub(r"\s+", " ", texto).strip()
+        return cls.WHITESPACE_PATTERN.sub(" ", texto).strip()
 
     def _extraer_descripcion(self, soup: BeautifulSoup) -> str:
         descripcion: list[str] = []
 
         for parrafo in soup.find_all("p"):
             texto = parrafo.get_text(" ", strip=True)
-            texto = re.sub(r"\s+", " ", texto).strip()
+            texto = self.WHITESPACE_PATTERN.sub(" ", texto).strip()
             if not texto:
                 continue
             if texto.startswith("*"):
@@ -368,7 +385,7 @@ class WatchWrestlingUfcScraper:
             return []
 
         return [
-            re.sub(r"\s+", " ", item.get_text(" ", strip=True)).strip()
+            self.WHITESPACE_PATTERN.sub(" ", item.get_text(" ", strip=True)).strip()
             for item in lista.find_all("li")
             if item.get_text(" ", strip=True)
         ]
@@ -396,7 +413,9 @@ class WatchWrestlingUfcScraper:
         group_index = 0
 
         for bloque in soup.select("div.src-name"):
-            nombre_grupo = re.sub(r"\s+", " ", bloque.get_text(" ", strip=True)).strip()
+            nombre_grupo = self.WHITESPACE_PATTERN.sub(
+                " ", bloque.get_text(" ", strip=True)
+            ).strip()
             if not nombre_grupo or nombre_grupo.lower() == "quick links!":
                 continue
 
@@ -406,7 +425,7 @@ class WatchWrestlingUfcScraper:
                 continue
 
             for bi, boton in enumerate(contenedor.select("button[data-src]"), start=1):
-                label = re.sub(r"\s+", " ", boton.get_text(" ", strip=True)).strip()
+                label = self.WHITESPACE_PATTERN.sub(" ", boton.get_text(" ", strip=True)).strip()
                 token = boton.get("data-src")
                 if not label or not token:
                     continue
@@ -884,10 +903,7 @@ class WatchWrestlingUfcScraper:
             return stream_data
 
         parsed_url = urlparse(provider_url)
-        if parsed_url.netloc and parsed_url.netloc not in {
-            "dailywrestling.cc",
-            "watch-wrestling.eu",
-        }:
+        if parsed_url.netloc and parsed_url.netloc not in self.SITE_DOMAINS:
             if "/embed/" in parsed_url.path or parsed_url.path.startswith("/e/"):
                 stream_data.update(
                     {
@@ -901,6 +917,20 @@ class WatchWrestlingUfcScraper:
 
         return stream_data
 
+    def _stream_responde(self, url: str) -> bool:
+        """Pide un solo byte: basta el código de estado y la conexión vuelve al pool."""
+        try:
+            with self.session.get(
+                url,
+                timeout=15,
+                allow_redirects=True,
+                stream=True,
+                headers=self.PROBE_HEADERS,
+            ) as response:
+                return response.status_code < 400
+        except Exception:
+            return False
+
     def _validar_stream_resuelto(self, stream_data: dict[str, Any]) -> bool:
         """Descarta enlaces caidos o paginas genericas sin video."""
         stream_url = stream_data.get("stream_url")
@@ -938,17 +968,7 @@ class WatchWrestlingUfcScraper:
 
         if provider == "okru":
             if stream_format in {"application/x-mpegurl", "video/mp4"} and stream_url:
-                try:
-                    response = self.session.get(
-                        stream_url,
-                        timeout=15,
-                        allow_redirects=True,
-                        stream=True,
-                        headers=self.DEFAULT_HEADERS,
-                    )
-                    return response.status_code < 400
-                except Exception:
-                    return False
+                return self._stream_responde(stream_url)
 
             provider_url = str(stream_data.get("provider_url") or "")
             if not provider_url:
@@ -983,17 +1003,7 @@ class WatchWrestlingUfcScraper:
             return not any(marker in lowered_body for marker in blocked_markers)
 
         if stream_format in {"application/x-mpegurl", "video/mp4"}:
-            try:
-                response = self.session.get(
-                    candidate_url,
-                    timeout=15,
-                    allow_redirects=True,
-                    stream=True,
-                    headers=self.DEFAULT_HEADERS,
-                )
-                return response.status_code < 400
-            except Exception:
-                return False
+            return self._stream_responde(candidate_url)
 
         if stream_format != "embed":
             return True
@@ -1017,20 +1027,22 @@ class WatchWrestlingUfcScraper:
         if parsed_final.path in {"", "/"}:
             return False
 
-        body = (response.text or "")[:5000].lower()
+        # Marcadores ASCII: se buscan en los bytes de la cabecera de la página,
+        # sin decodificar (ni detectar charset de) el HTML completo
+        cabecera = response.content[:5000].lower()
         invalid_markers = (
-            "page not found",
-            "video not found",
-            "file was deleted",
-            "file is no longer available",
-            "video unavailable",
-            "404 not found",
-            "was removed",
-            "doesn't exist",
-            "do not exist",
-            "not available",
+            b"page not found",
+            b"video not found",
+            b"file was deleted",
+            b"file is no longer available",
+            b"video unavailable",
+            b"404 not found",
+            b"was removed",
+            b"doesn't exist",
+            b"do not exist",
+            b"not available",
         )
-        if any(marker in body for marker in invalid_markers):
+        if any(marker in cabecera for marker in invalid_markers):
             return False
 
         return True
@@ -1071,13 +1083,11 @@ class WatchWrestlingUfcScraper:
             self._log_warning(f"No se pudo abrir embed VidFrame {provider_url}: {e}")
             return None
 
-        match = re.search(r'file:\s*"([^"]+\.m3u8[^"]*)"', response.text)
-        if match:
-            return match.group(1)
-
-        match = re.search(r"file:\s*'([^']+\.m3u8[^']*)'", response.text)
-        if match:
-            return match.group(1)
+        body = response.content
+        for pattern in self.VIDFRAME_M3U8_PATTERNS:
+            match = pattern.search(body)
+            if match:
+                return match.group(1).decode("utf-8", errors="replace")
 
         return None
 
@@ -1195,8 +1205,8 @@ class WatchWrestlingUfcScraper:
 
         return None
 
-    @staticmethod
-    def _es_embed_web_usable(url: str) -> bool:
+    @classmethod
+    def _es_embed_web_usable(cls, url: str) -> bool:
         lowered = (url or "").lower()
         if any(
             marker in lowered
@@ -1220,10 +1230,7 @@ class WatchWrestlingUfcScraper:
             return True
 
         parsed_url = urlparse(url or "")
-        if parsed_url.netloc and parsed_url.netloc not in {
-            "dailywrestling.cc",
-            "watch-wrestling.eu",
-        }:
+        if parsed_url.netloc and parsed_url.netloc not in cls.SITE_DOMAINS:
             return "/embed/" in parsed_url.path or parsed_url.path.startswith("/e/")
 
         return False
@@ -1283,8 +1290,7 @@ class WatchWrestlingUfcScraper:
                 numeric_qualities.append((int(str(key)), str(key), sources[0]))
 
         if numeric_qualities:
-            numeric_qualities.sort(key=lambda item: item[0], reverse=True)
-            _, label, source = numeric_qualities[0]
+            _, label, source = max(numeric_qualities, key=itemgetter(0))
             return label, source
 
         auto_sources = quality_sources.get("auto") or []
@@ -1380,17 +1386,17 @@ class WatchWrestlingUfcScraper:
             sibling = sibling.find_next_sibling()
         return None
 
-    @staticmethod
-    def _detectar_tipo_evento(title: str) -> str:
+    @classmethod
+    def _detectar_tipo_evento(cls, title: str) -> str:
         title_upper = title.upper()
         if "FIGHT NIGHT" in title_upper:
             return "fight_night"
-        if re.search(r"\bUFC\s+\d+\b", title_upper):
+        if cls.UFC_NUMERADO_PATTERN.search(title_upper):
             return "numbered"
         return "other"
 
     def _extraer_fecha_evento(self, title: str, post: dict[str, Any]) -> str | None:
-        match = re.search(r"(\d{1,2})/(\d{1,2})/(\d{2,4})", title)
+        match = self.FECHA_TITULO_PATTERN.search(title)
         if match:
             mes, dia, year = match.groups()
             year_int = int(year)
@@ -62,6 +62,9 @@ PUBLIC_DOMAIN_ENV = "PUBLIC_DOMAIN"
 PUBLIC_DOMAIN_DEFAULT_LOCAL = "http://localhost:8000"
 PUBLIC_DOMAIN_DEFAULT_DOCKER = "https://tudominio.com"
 
+# ===== JSON cache cliente =====
+JSON_GZIP_COMPRESSLEVEL = 6  # 9 (default de gzip) apenas reduce tamaño y es mucho más lento
+
 # ===== Logos y recursos =====
 DEFAULT_LOGO_URL = "https://via.placeholder.com/150"
 
@@ -101,5 +104,5 @@ DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.
 # ===== Health Check Streams =====
 HEALTH_CHECK_TIMEOUT = 8  # segundos por request
 HEALTH_CHECK_CONCURRENCY = 10  # requests simultáneos
-HEALTH_CHECK_BYTES = 4096  # bytes a descargar para validar contenido
+HEALTH_CHECK_BYTES = 1  # basta un byte: solo se comprueba que el cuerpo no esté vacío
 HEALTH_CHECK_TOTAL_TIMEOUT = 120  # timeout total del health check
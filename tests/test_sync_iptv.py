@@ -9,11 +9,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from iptv_scrapper.sync_iptv import (
     contains_language,
+    extraer_atributo_extinf,
     extraer_año,
+    extraer_grupo_y_nombre_m3u,
     extraer_idioma_desde_grupo,
     extraer_idioma_desde_nombre,
+    iterar_lineas_m3u,
     limpiar_etiquetas_calidad,
     normalizar_idioma,
+    parsear_m3u,
     quitar_prefijo_idioma,
     split_extinf_line,
 )
@@ -127,6 +131,77 @@ class TestSplitExtinfLine:
         _meta, name = split_extinf_line("#EXTINF:-1,Canal, Test, Extra")
         assert name == "Canal, Test, Extra"
 
+    def test_grupo_y_nombre(self):
+        line = '#EXTINF:-1 tvg-name="Otro" group-title="ES - Fútbol",Canal Test'
+        assert extraer_grupo_y_nombre_m3u(line) == ("ES - Fútbol", "Canal Test")
+
+    def test_nombre_vacio_usa_tvg_name(self):
+        line = '#EXTINF:-1 tvg-name=" ES - Canal " group-title="ES - Fútbol",'
+        assert extraer_grupo_y_nombre_m3u(line) == ("ES - Fútbol", "ES - Canal")
+
+    def test_sin_nombre_ni_tvg_name(self):
+        assert extraer_grupo_y_nombre_m3u('#EXTINF:-1 group-title="ES"') == ("ES", "")
+
+    def test_sin_group_title(self):
+        assert extraer_grupo_y_nombre_m3u("#EXTINF:-1,Canal") == ("", "Canal")
+
+
+class TestIterarLineasM3u:
+    def _compara_con_split(self, contenido):
+        assert list(iterar_lineas_m3u(contenido)) == contenido.split("\n")
+
+    def test_vacio(self):
+        self._compara_con_split("")
+
+    def test_salto_final(self):
+        self._compara_con_split("#EXTM3U\n#EXTINF:-1,Canal\nhttp://x/1\n")
+
+    def test_sin_salto_final(self):
+        self._compara_con_split("#EXTM3U\n#EXTINF:-1,Canal\nhttp://x/1")
+
+    def test_crlf(self):
+        self._compara_con_split("#EXTM3U\r\n#EXTINF:-1,Canal\r\nhttp://x/1\r\n")
+
+
+class TestExtraerAtributoExtinf:
+    def test_atributo_presente(self):
+        line = '#EXTINF:-1 tvg-id="a.es" group-title="ES - Fútbol",Canal'
+        assert extraer_atributo_extinf(line, 'tvg-id="') == "a.es"
+        assert extraer_atributo_extinf(line, 'group-title="') == "ES - Fútbol"
+
+    def test_atributo_ausente(self):
+        assert extraer_atributo_extinf("#EXTINF:-1,Canal", 'tvg-id="') == ""
+
+    def test_comilla_sin_cerrar(self):
+        assert extraer_atributo_extinf('#EXTINF:-1 tvg-id="a.es', 'tvg-id="') == "a.es"
+
+
+class TestParsearM3u:
+    def test_item_completo(self):
+        items = parsear_m3u(
+            '#EXTM3U\n#EXTINF:-1 tvg-id="a.es" group-title="ES - Fútbol",Canal\nhttp://x/1\n'
+        )
+        assert items == [
+            {
+                "name": "Canal",
+                "group": "ES - Fútbol",
+                "logo": "",
+                "tvg_id": "a.es",
+                "url": "http://x/1",
+            }
+        ]
+
+    def test_linea_sin_coma(self):
+        items = parsear_m3u('#EXTINF:-1 group-title="ES"\nhttp://x/1')
+        assert items[0]["name"] == "Unknown"
+
+    def test_nombre_con_comas_toma_el_ultimo_tramo(self):
+        items = parsear_m3u('#EXTINF:-1 group-title="ES",Película, La (2020)\nhttp://x/1')
+        assert items[0]["name"] == "La (2020)"
+
+    def test_url_sin_extinf_se_ignora(self):
+        assert parsear_m3u("#EXTM3U\nhttp://x/1\n") == []
+
 
 class TestExtraerAño:
     def test_anio_simple(self):